@@ -0,0 +1,22 @@
+########################### Page registry for the dashboard ####################################################
+#
+# Each entry maps the label shown in the sidebar to the module that renders it.
+# Page modules are only imported when their page is first selected, so each one
+# pulls in its own plotting libraries and data on demand instead of at start-up.
+
+import importlib
+
+PAGES = {
+    "Dashboard Overview": "dashboard_pages.overview",
+    "User Analysis": "dashboard_pages.user_analysis",
+    "Weather and Bike Usage": "dashboard_pages.weather",
+    "Top Stations Analysis": "dashboard_pages.top_stations",
+    "Interactive Trip Map": "dashboard_pages.trip_map",
+    "Strategic Recommendations": "dashboard_pages.recommendations",
+}
+
+
+def render_page(name):
+    # Python keeps imported modules in sys.modules, so later reruns reuse the already loaded page
+    module = importlib.import_module(PAGES[name])
+    module.render()
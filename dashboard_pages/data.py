@@ -0,0 +1,13 @@
+########################## Import data ###########################################################################################
+#
+# The CSV is read once per server process and shared across reruns and sessions.
+# Only the pages that chart the trip data call this, so the Overview and
+# Recommendations pages never touch pandas or the CSV.
+
+import streamlit as st
+import pandas as pd
+
+
+@st.cache_data
+def load_trips():
+    return pd.read_csv('reduced_data_nyc_to_plot_7.csv', index_col = 0)
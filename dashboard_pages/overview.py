@@ -0,0 +1,55 @@
+import streamlit as st
+from PIL import Image
+
+
+### Dashboard Overview
+
+def render():
+    st.markdown("""
+
+    This dashboard provides a comprehensive analysis of the challenges and opportunities facing **Citi Bikes** as they **expand their services**. It is designed to **uncover insights** into **customer behavior**, **station usage** and **seasonal patterns**, enabling data-driven decision-making to improve operations and user satisfaction.
+
+    """)
+
+    # Inject custom CSS for styling
+    st.markdown( """
+        <style>
+        div[data-testid="stMetricValue"] {
+            background-color: #f0f0f0; /* Light grey background */
+            border-radius: 5px; /* Rounded corners */
+            padding: 10px; /* Spacing inside the container */
+            color: black; /* Text color for contrast */
+        }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+
+     # Highlight Section
+    st.markdown("### Highlights at a Glance")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric(label="Total Users", value="242,200")
+        st.metric(label="Average Trip Duration", value="9.80 minutes")
+    with col2:
+        st.metric(label="Peak Usage Season", value="Summer")
+        st.metric(label="Top Station", value="Streeter Dr & Grand Ave")
+
+    st.divider()
+
+    # Section Overview
+
+    st.markdown("""
+        ### Explore Key Insights:
+        Currently, Citi Bikes **encounters issues such as bikes not being available during peak times or in high-demand areas**. This analysis **aims to address these concerns** by investigating the following **key areas**:
+
+        - **Most Popular Stations**: Identifying high-traffic stations and understanding trip patterns.
+        - **User Analysis**: Understand the profile of Citi Bikes' customer base.
+        - **Weather and Bike Usage**: Examining the impact of seasonal and temperature changes on bike activity.
+        - **Interactive Map with Aggregated Bike Trips**: Visualizing trip flow and station connectivity across New York City.
+        - **Recommendations**: Providing actionable strategies to optimize resource allocation and enhance the overall user experience.
+    """)
+    # Add a divider
+    st.markdown("---")
+    bikes = Image.open("intro_2.jpeg")  #source: https://designer.microsoft.com/image-creator
+    st.image(bikes, caption="Explore detailed insights for improved bike operations and user satisfaction.")
@@ -0,0 +1,137 @@
+import streamlit as st
+from PIL import Image
+
+
+########### Recommendations ##################
+
+def render():
+     # Subheader and Description
+    st.subheader("Strategic Recommendations")
+
+    st.markdown("""
+    This section provides **actionable insights to optimize NYC bike operations**, ensuring scalability, efficient station distribution, and stock management. By addressing seasonal trends and high-demand areas, these recommendations aim to enhance user satisfaction and operational efficiency.
+    """)
+    # Inject custom CSS for styling
+    st.markdown( """
+        <style>
+        div[data-testid="stMetricValue"] {
+            background-color: #f0f0f0; /* Light grey background */
+            border-radius: 5px; /* Rounded corners */
+            padding: 10px; /* Spacing inside the container */
+            color: black; /* Text color for contrast */
+        }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # Metrics Section
+    st.markdown("### Key Metrics")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(label="Stations Impacted", value="50+")
+    with col2:
+        st.metric(label="Seasonal Scaling", value="30-40% Reduction")
+    with col3:
+        st.metric(label="Peak Coverage", value="90% Demand Fulfilled")
+
+    st.divider()
+
+    # Inject custom CSS for styling expanders
+    st.markdown("""
+    <style>
+    div[data-testid="stExpander"] {
+        background-color: #FDF5E6 !important; /* Light beige background */
+        border: 1px solid #FDF5E6; /* Light beige background */
+        border-radius: 8px; /* Slightly more rounded corners */
+        padding: 12px; /* Internal padding for better spacing */
+        margin-bottom: 15px; /* Space between expanders */
+        box-shadow: 0px 2px 5px rgba(0,0,0,0.1); /* Subtle shadow for depth */
+    }
+    div[data-testid="stExpander"] > div {
+        color: #333333 !important; /* Darker text for readability */
+        font-size: 14px; /* Uniform font size */
+        line-height: 1.6; /* Improved line spacing */
+    }
+    div[data-testid="stExpander"] > div:first-child {
+        font-weight: bold; /* Bold first line */
+        font-size: 16px; /* Slightly larger font for the header */
+        margin-bottom: 8px; /* Add space below the header */
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+    # Recommendations Section
+    st.markdown("### Detailed Recommendations")
+    with st.expander("1. **Scaling Bikes Back Between November and April**"):
+        st.markdown("""
+        - **Recommendation**: Reduce bike availability by approximately **30-40%** during the colder months (November to April).
+        - **Rationale**: 
+            - Bike usage drops significantly as temperatures fall, especially below freezing.
+            - Retain higher availability in downtown and transit hubs to meet commuter needs.
+        - **Implementation**: 
+            - Analyze trip data to identify stations with low demand during winter.
+            - Reallocate resources to high-demand areas for better efficiency.
+        """)
+
+    with st.expander("2. **Determining How Many More Stations to Add Along the Water**"):
+        st.markdown("""
+        - **Steps**:
+            1. **Analyze Trip Data**:
+                - Identify high-demand stations along the waterfront, such as **Streeter Dr & Grand Ave**.
+                - Pinpoint areas where station coverage is sparse.
+            2. **Heatmap Analysis**:
+                - Create heatmaps to visualize bike traffic along the waterfront.
+                - Focus on identifying underserved regions.
+            3. **User Feedback**:
+                - Conduct surveys or feedback sessions to understand user preferences for new stations.
+                - Include both casual users (recreational needs) and members (commuting patterns).
+            4. **Simulation Models**:
+                - Use demand forecasting models to simulate the impact of new stations on overall trip volume and station balance.
+            5. **Benchmarking**:
+                - Compare lakefront station density with high-demand inland areas, ensuring equitable resource distribution.
+
+        - **Rationale**:
+            - Adding stations in high-demand waterfront areas improves accessibility for recreational users and boosts overall system coverage.
+            - Stations near tourist hotspots can attract more casual riders, driving revenue during peak seasons.
+
+        - **Outcome**:
+            - Expanded waterfront coverage that caters to both commuting and recreational needs, ensuring balanced bike distribution across the network.
+        """)
+
+    with st.expander("3. **Ensuring Bikes Are Always Stocked at Popular Stations**"):
+        st.markdown("""
+        - **Strategies**:
+            - Leverage **real-time monitoring** to track bike availability and redistribute bikes dynamically.
+            - Implement **predictive analytics** to forecast demand during peak hours.
+            - Provide **user incentives** (e.g., discounts, rewards) for returning bikes to high-demand stations.
+            - Deploy **dedicated logistics teams** to prioritize key stations like **West St & Chambers St** and **Central Park South**.
+            - Add **overflow docking capacity** at high-traffic locations to avoid bottlenecks during busy periods.
+        - **Outcome**: Improved bike availability and reduced wait times at popular stations.
+        """)
+
+    st.divider()
+    # Insights Section
+    st.markdown("""
+    ### Additional Insights
+    - **User Type Trends**:
+        - Casual users primarily ride during weekends and summer months, favoring recreational hotspots.
+        - Members show consistent usage year-round, indicating commuter reliance on the service.
+    - **Seasonal Adjustments**:
+        - Ensure robust operations during summer, the peak season for casual users.
+        - Scale back resources in winter while maintaining access for members.
+    - **Geographic Focus**:
+        - Expand station placements in underserved high-traffic areas identified through trip data and heatmaps.
+    """)
+
+
+    st.markdown("""
+
+    By implementing these recommendations, Citi Bikes can **optimize bike availability**, **expand service coverage along the waterfront**, and ensure **user satisfaction** at high-demand stations throughout the year.
+    """)
+    # Add a divider
+    st.markdown("---")
+    bikes = Image.open("nyc_image_2.jpeg")  #source: generated by Chatgpt 
+
+    # Display the image
+    st.image(bikes, caption="Strategic recommendations for NYC Citi bike optimization.")
@@ -0,0 +1,130 @@
+import streamlit as st
+import plotly.graph_objects as go
+from dashboard_pages.data import load_trips
+
+
+######### Top Stations Analysis #####
+
+def render():
+    df = load_trips()
+
+    st.subheader("Top Stations Analysis")
+    st.markdown("""
+    This page provides an **in-depth analysis of the top 20 start and end stations** for Citi Bike usage. Data is segmented by user type (members or casual users) and seasonal patterns to uncover usage trends. The insights aim to **highlight station popularity**, **peak usage periods**, and **user behavior**, enabling data-driven decisions to optimize station locations and resource allocation.
+
+    """)
+
+ # Inject custom CSS for styling
+    st.markdown("""
+        <style>
+        div[data-testid="stMetricValue"] {
+            background-color: #f7f7f7;
+            border-radius: 5px;
+            padding: 10px;
+            color: black;
+            text-align: center;
+        }
+        </style>
+    """, unsafe_allow_html=True
+        )
+
+  #Sidebar Filter on usertype
+    usertype_filter = st.sidebar.multiselect(
+        label="Select Usertype",
+        options=df['usertype'].unique(),
+        default=df['usertype'].unique(),
+        help="Filter data by user type: casual or member."
+    )
+        # Season filter
+    with st.sidebar:
+        season_filter = st.multiselect(
+            label="Select Season",
+            options=df['season'].unique(),
+            default=df['season'].unique()
+        )
+
+
+    df1 = df.query("season in @season_filter and usertype in @usertype_filter")
+
+    # Summary Metrics
+    st.markdown("### Key Metrics")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        total_trips = int(df['bike_rides_daily'].count())
+        st.metric("Total Trips", f"{total_trips:,}")
+    with col2:
+        most_popular_start = df.groupby('start_station_name').size().idxmax()
+        st.metric("Most Popular Start", most_popular_start)
+    with col3:
+        avg_trips_per_station = df['bike_rides_daily'].mean()
+        st.metric("Avg. Trips per Station", f"{avg_trips_per_station:,.1f}")
+
+    st.divider()
+
+    # Charts Section
+    st.markdown("### Top Stations Overview")
+
+    # Create two columns for side-by-side chart display
+    chart_col1, chart_col2 = st.columns(2)
+
+   # Bar chart
+     # Start Stations Chart
+    df1['value'] = 1
+    df_groupby_bar = df1.groupby('start_station_name', as_index=False).agg({'value': 'sum'})
+    top20 = df_groupby_bar.nlargest(20, 'value')
+
+    with chart_col1:
+        st.markdown("#### Top 20 Start Stations")
+        fig = go.Figure(go.Bar(x=top20['start_station_name'], y=top20['value'],
+                               marker={'color': top20['value'], 'colorscale': 'Blues'}))
+        fig.update_layout(
+            title="",
+            xaxis_title="Start Stations",
+            yaxis_title="Number of Trips",
+            height=500
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    # End Stations Chart
+    df1['value'] = 1
+    df_groupby_bar2 = df1.groupby('end_station_name', as_index=False).agg({'value': 'sum'})
+    top20_end = df_groupby_bar2.nlargest(20, 'value')
+
+    with chart_col2:
+        st.markdown("#### Top 20 End Stations")
+        fig = go.Figure(go.Bar(x=top20_end['end_station_name'], y=top20_end['value'],
+                               marker={'color': top20_end['value'], 'colorscale': 'Blues'}))
+        fig.update_layout(
+            title="",
+            xaxis_title="End Stations",
+            yaxis_title="Number of Trips",
+            height=500
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    st.divider()
+
+    # Insights Section
+    st.markdown("""
+    ### Insights
+      1. **Key Differences Between Members and Casual Users**:
+       - **Members** primarily use bikes for commuting, focusing on stations near business districts and residential areas.
+       - **Casual Users** favor stations near recreational and tourist areas, highlighting leisure-oriented rides.
+
+    2. **Seasonal Trends**:
+       - **Members**: Show consistent usage year-round, with only slight declines during winter.
+       - **Casual Users**: Exhibit sharp seasonal dependency, with peak activity in summer and a significant drop in winter.
+
+    3. **Top Station Preferences**:
+       - Stations like **West St & Chambers St** and **Central Park South** are heavily used by both members and casual users.
+       - Casual users display higher preference for stations near parks and tourist hubs, such as **Streeter Dr & Grand Ave**.
+
+    4. **Summer vs. Winter Usage**:
+       - **Summer**:
+         - Members use bikes for daily commutes, with steady weekday activity.
+         - Casual users dominate weekends, with high activity near recreational spots.
+       - **Winter**:
+         - Members maintain steady but lower usage, focused on transit hubs.
+         - Casual users show minimal activity, with sharp declines in all recreational areas.
+
+    """)
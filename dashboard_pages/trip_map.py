@@ -0,0 +1,60 @@
+import streamlit as st
+
+
+######### Interactive Trip Map #####
+
+def render():
+    st.subheader("Interactive Trip Map")
+
+    ### Create the map ###
+
+    st.markdown("""
+
+    This page provides a dynamic visualization of bike trips across New York, **highlighting the most popular routes and stations**. The interactive map allows you to explore the start and end points of bike trips, with visual arcs representing the flow of trips between stations.
+
+    Key insights from this visualization include:
+    - Identifying the **busiest bike routes** in the city.
+    - Understanding **trip patterns** and **station connectivity**.
+    - Gaining a better sense of **how stations are utilized** throughout the city.
+
+    Use this map to analyze high-demand areas, optimize resource allocation, and enhance the overall biking experience for users.
+    """)
+    path_to_html = "kepler.gl (8).html" 
+
+    # Read file and keep in variable
+    with open(path_to_html,'r') as f: 
+        html_data = f.read()
+
+    st.divider()
+    ## Show in webpage
+    st.header("Aggregated Bike Trips in New York")
+    st.components.v1.html(html_data,height=500)
+    st.caption("Interactive visualization of aggregated bike trips across New York City, highlighting popular routes and connections between key locations in 2022. This map provides insights into travel patterns, helping optimize bike station placements and availability.")
+
+    st.divider()
+    st.markdown("""
+    ### Key Insights: Aggregated Bike Trips in New York
+
+    1. **Concentration Near Key Areas**:
+       - The most active stations are concentrated near popular landmarks and hubs such as **Streeter Dr & Grand Ave**, **Theater on the Lake**, and other locations near downtown Chicago.
+       - These areas likely have a high volume of commuter traffic as well as recreational riders.
+
+    2. **Lakefront and Tourist Attractions**:
+       - A significant number of trips originate or end along the lakefront, highlighting its appeal as a recreational destination.
+       - Locations near Millennium Park and Navy Pier show consistent activity, suggesting their popularity among tourists and locals alike.
+
+    3. **Downtown Core as a Connectivity Hub**:
+       - Downtown Chicago acts as a central hub for bike trips, with many routes connecting stations in this area to residential neighborhoods and commercial zones.
+       - This pattern indicates that many users rely on bikes for last-mile connectivity between public transit and their destinations.
+
+    4. **Station Pairings and Commuter Patterns**:
+       - Frequently traveled routes include stations near major business districts and residential areas, emphasizing the importance of bikes in daily commuting.
+       - For example, high traffic between **Streeter Dr & Grand Ave** and **Theater on the Lake** may indicate commuting between residential areas and workplaces or schools.
+
+    5. **Recommendations for Resource Allocation**:
+       - **Increase bike availability at key stations**: Stations near downtown and the lakefront should have increased bike stock during peak hours and seasons to accommodate demand.
+       - **Enhance connectivity**: Consider adding new stations or improving infrastructure near underserved areas to connect them to the primary bike network.
+       - **Targeted campaigns**: Promote biking as a viable transportation option for commuting and recreational use, particularly in high-demand areas such as the downtown core and lakefront.
+
+    By analyzing these patterns, Divvy Bikes can improve station management, optimize bike availability, and better cater to the needs of Chicago's diverse biking community.
+    """)
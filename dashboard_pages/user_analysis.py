@@ -0,0 +1,144 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from dashboard_pages.data import load_trips
+
+
+######### user analysis #####
+
+def render():
+    df = load_trips()
+
+    st.subheader("User Analysis")
+    st.markdown("""Explore user behavior and usage patterns of Citi Bikes, broken down by user type, activity time, and weekday versus weekend trends. This page provides an in-depth analysis of:
+
+- **General Metrics**: Total number of users, average trip duration, and peak usage day.
+- **User Type Distribution**: Comparison of usage between casual riders and members.
+- **Activity Patterns**:
+  - Weekday vs. weekend activity trends.
+  - Daily and hourly bike ride variations.
+- **Bike Type Preference**: Breakdown of bike usage across classic and electric bike types.
+
+This analysis helps identify user preferences, optimize operations for high-demand times, and tailor services to user behavior.
+""")
+
+    # Inject custom CSS for styling
+    st.markdown( """
+        <style>
+        div[data-testid="stMetricValue"] {
+            background-color: #f0f0f0; /* Light grey background */
+            border-radius: 5px; /* Rounded corners */
+            padding: 10px; /* Spacing inside the container */
+            color: black; /* Text color for contrast */
+        }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    #Sidebar Filter on usertype
+    usertype_filter = st.sidebar.multiselect(
+        label="Select Usertype",
+        options=df['usertype'].unique(),
+        default=df['usertype'].unique(),
+        help="Filter data by user type: casual or member."
+    )
+
+    # Filter the DataFrame using the usertype                             
+    df2 = df.query("usertype in @usertype_filter")
+
+    # Metrics Section
+    st.markdown("### General Metrics")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        total_users = int(df2['usertype'].count())    
+        st.metric(label="Total Users", value=f"{total_users:,}")
+    with col2:
+        avg_trip = float(df2['trip_duration_minutes'].median())
+        st.metric(label="Avg. Trip Minutes", value=f"{avg_trip:.2f}")
+    with col3:
+        peak_day = df2['day_of_week'].mode()[0]
+        st.metric(label="Peak Usage Day", value=peak_day)
+
+
+    st.divider()
+
+    # Chart Section - Usage Patterns
+    st.markdown("### Usage Patterns")
+    chart_col1, chart_col2 = st.columns(2)
+    with chart_col1:
+        fig_bike = px.histogram(df2, x='bike_type', title="Bike Usage", color='bike_type')
+        st.plotly_chart(fig_bike, use_container_width=True)
+    with chart_col2:
+        fig_usertype = px.histogram(df2, x='usertype', title="User Type Distribution", color='usertype')
+        st.plotly_chart(fig_usertype, use_container_width=True)
+
+    # Chart Section - Activity Patterns
+    st.markdown("### Activity Patterns")
+    chart_col1, chart_col2 = st.columns(2)
+
+   # Weekday vs Weekend
+    activity_data = df2.groupby('weekday_or_weekend')['bike_rides_daily'].count().reset_index()
+    with chart_col1:
+        fig = px.bar(
+            activity_data,
+            x='weekday_or_weekend',
+            y='bike_rides_daily',
+            title="Activity: Weekday vs Weekend",
+            color='weekday_or_weekend',
+            text='bike_rides_daily'
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+
+    # Day of the Week
+    activity_by_day = df2.groupby('day_of_week')['bike_rides_daily'].count().reset_index()
+
+    # Correct day order
+    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+    # Assign correct order to 'day_of_week'
+    activity_by_day['day_of_week'] = pd.Categorical(activity_by_day['day_of_week'], categories=day_order, ordered=True)
+
+    # Sort by the new category order
+    activity_by_day = activity_by_day.sort_values('day_of_week')
+
+    # Plot the graph
+    with chart_col2:
+        fig = px.line(
+            activity_by_day,
+            x='day_of_week',
+            y='bike_rides_daily',
+            title="Daily Activity (Monday to Sunday)",
+            labels={'day_of_week': 'Day of the Week', 'bike_rides_daily': 'Number of Bike Rides'},
+            markers=True
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    # Hourly Activity
+    st.markdown("### Hourly Activity Patterns")
+    weekday_activity = df2[df2['weekday_or_weekend'] == 'Weekday'].groupby('hour')['bike_rides_daily'].count().reset_index()
+    weekend_activity = df2[df2['weekday_or_weekend'] == 'Weekend'].groupby('hour')['bike_rides_daily'].count().reset_index()
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=weekday_activity['hour'], y=weekday_activity['bike_rides_daily'], mode='lines+markers', name='Weekday', line=dict(color='blue')))
+    fig.add_trace(go.Scatter(x=weekend_activity['hour'], y=weekend_activity['bike_rides_daily'], mode='lines+markers', name='Weekend', line=dict(color='orange')))
+    fig.update_layout(
+            title="Hourly Activity: Weekday vs Weekend",
+            xaxis_title="Hour of the Day",
+            yaxis_title="Number of Bike Rides",
+            legend_title="Day Type",
+            xaxis=dict(tickmode='linear', tick0=0, dtick=1),
+            template="plotly_white"
+        )
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.divider()
+    # Key Insights
+    st.markdown("""
+    ### Key Insights 
+    1. **User Types**: Casual users tend to use bikes more on weekends, while members show consistent usage across weekdays.
+    2. **Trip Duration**: Casual users take longer trips compared to members.
+    3. **Peak Days and Hours**: Activity peaks on Saturdays and during commuting hours on weekdays.
+    4. **Bike Type Preferences**: Electric bikes are popular for longer trips, while classic bikes dominate shorter, frequent commutes.
+    """)
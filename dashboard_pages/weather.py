@@ -0,0 +1,108 @@
+import streamlit as st
+from plotly.subplots import make_subplots
+import plotly.graph_objects as go
+from dashboard_pages.data import load_trips
+
+
+######### Weather and Bike Usage #####
+
+def render():
+    df = load_trips()
+
+    st.subheader("Weather and Bike Usage")
+
+  # Introduction and description
+    st.markdown("""
+    This section explores the relationship between **weather patterns and bike usage** in New York 2022. 
+    By analyzing daily bike trips alongside average daily temperatures, we aim to **uncover how seasonal and weather-related factors influence biking activity**. 
+    These insights will guide better planning and resource allocation throughout the year.
+    """)
+
+# Inject custom CSS for styling
+    st.markdown( """
+        <style>
+        div[data-testid="stMetricValue"] {
+            background-color: #f0f0f0; /* Light grey background */
+            border-radius: 5px; /* Rounded corners */
+            padding: 10px; /* Spacing inside the container */
+            color: black; /* Text color for contrast */
+        }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+
+
+    # Summary Metrics
+    st.markdown("### Key Metrics")
+
+   # Adjusted the number of columns to 3
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        total_rides = df['bike_rides_daily'].count() 
+        st.metric("Total Rides", f"{total_rides:,}")
+    with col2:
+        avg_temp = df['avgTemp'].mean() 
+        st.metric("Avg. Temperature (°C)", f"{avg_temp:.1f}")
+    with col3:
+        peak_season_rides = df[df['avgTemp'] > 20]['bike_rides_daily'].count()  
+        st.metric("Peak Season Rides", f"{peak_season_rides:,}")
+
+    st.divider()
+    # Visualization
+    st.markdown("### Daily Bike Rides and Temperatures")
+    fig_2 = make_subplots(specs=[[{"secondary_y": True}]])
+
+   # Add bike rides data
+    fig_2.add_trace(
+    go.Scatter(x = df['date'], y = df['bike_rides_daily'], name = 'Daily bike rides', marker={'color': df['bike_rides_daily'],'color': 'blue'}),
+    secondary_y = False
+    )
+    # Add temperature data
+    fig_2.add_trace(
+    go.Scatter(x=df['date'], y = df['avgTemp'], name = 'Daily temperature', marker={'color': df['avgTemp'],'color': 'red'}),
+    secondary_y=True
+    )
+
+    # Add horizontal line at 0 degrees
+    fig_2.add_shape(
+        type="line",
+        x0=df['date'].min(),
+        x1=df['date'].max(),
+        y0=0,
+        y1=0,
+        xref="x",
+        yref="y2",
+        line=dict(color="black", dash="dash"),
+        name='0°C'
+    )
+
+    fig_2.update_layout(
+        title="Daily Bike Trips and Temperatures",
+        xaxis_title="Date",
+        yaxis_title="Bike Rides",
+        yaxis2_title="Temperature (°C)",
+        height=500,
+        template="plotly_white"
+    )
+
+    st.plotly_chart(fig_2, use_container_width=True)
+
+    st.divider()
+    # Insights Section
+    st.markdown("### Insights")
+    st.markdown("""
+    1. **Correlation Between Temperature and Bike Usage**:
+       - Warmer months (May to October) see significantly higher bike usage.
+       - Usage drops sharply when temperatures fall below freezing (0°C).
+    2. **Seasonal Peaks and Lows**:
+       - Highest usage occurs in summer (June–August), with a gradual decline starting in September.
+       - Winter months (January to March, November to December) show the lowest activity.
+    3. **Transitional Seasons**:
+       - Spring (March–April) and fall (October) show variable usage, likely due to fluctuating weather conditions.
+    4. **Key Recommendations**:
+       - Prioritize bike availability and maintenance during peak seasons.
+       - Introduce winter biking initiatives, such as promotions and gear support.
+       - Optimize operations to align with seasonal trends, ensuring cost-efficiency.
+    """)